@@ -0,0 +1,27 @@
+"""Helpers shared by the CLI and interactive mode."""
+
+import json
+from typing import Any
+
+# First characters of a JSON object, array, string, true/false/null, or number
+_JSON_START_CHARS = frozenset('{["tfn-0123456789')
+
+
+def parse_param_value(value: str) -> Any:
+    """Parse an input value given as text, as JSON if it is valid JSON.
+
+    Values that cannot start a JSON document (the common string case) skip the
+    parse attempt.
+
+    Args:
+        value: Value text, e.g. the part after "=" in key=value.
+
+    Returns:
+        The parsed JSON value, or the text unchanged if it is not valid JSON.
+    """
+    if value.lstrip()[:1] in _JSON_START_CHARS:
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+    return value
@@ -1,29 +1,59 @@
 """CLI commands for PW Workflow Runner."""
 
-import json
 import os
-import shutil
-import signal
-import subprocess
 import sys
+from functools import cache, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import click
-from dotenv import load_dotenv
-from rich.console import Console
-from rich.table import Table
 
-from parallelworks_client import extract_platform_host
+if TYPE_CHECKING:
+    import subprocess
+    from collections import deque
 
-from .client import PWClient, PWClientError
-from .executor import ExecutionResult, ExecutionTimeout, WorkflowExecutor
-from .models import RunInfo, WorkflowType
+    from rich.console import Console
 
-# Load .env file if present
-load_dotenv()
+    from .client import PWClient
+    from .executor import ExecutionResult
+    from .models import RunInfo
 
-console = Console()
+
+def _load_dotenv() -> None:
+    """Load a .env file if present, without overriding variables already set.
+
+    Set PW_SKIP_DOTENV=1 to skip the lookup (and the dotenv import) entirely,
+    e.g. when calling the CLI in a tight scripting loop.
+    """
+    if os.environ.get("PW_SKIP_DOTENV"):
+        return
+
+    from dotenv import find_dotenv, load_dotenv
+
+    dotenv_path = find_dotenv(usecwd=True)
+    if dotenv_path:
+        load_dotenv(dotenv_path, override=False)
+
+
+@cache
+def _console(stderr: bool = False) -> "Console":
+    """Return the shared rich Console for stdout (or stderr), created on first use.
+
+    Repr highlighting is only turned on for a terminal; rich already drops
+    colors itself when output is piped or NO_COLOR is set.
+    """
+    from rich.console import Console
+
+    stream = sys.stderr if stderr else sys.stdout
+    return Console(stderr=stderr, highlight=stream.isatty())
+
+
+@lru_cache(maxsize=4)
+def _platform_host(api_key: str) -> str:
+    """Return the platform host encoded in an API key, decoded once per key."""
+    from parallelworks_client import extract_platform_host
+
+    return extract_platform_host(api_key)
 
 
 def _start_ssh_tunnel(
@@ -31,7 +61,7 @@ def _start_ssh_tunnel(
     local_port: int,
     remote_port: int,
     debug: bool = False,
-) -> subprocess.Popen:
+) -> "subprocess.Popen":
     """Start an SSH tunnel to the workspace using the pw CLI.
 
     Args:
@@ -43,29 +73,36 @@ def _start_ssh_tunnel(
     Returns:
         Popen process for the SSH tunnel.
     """
+    import shlex
+    import shutil
+    import subprocess
+
     # Check if pw CLI is available
     if not shutil.which("pw"):
         raise RuntimeError(
             "pw CLI not found. Install it from https://parallelworks.com/docs/cli/pw"
         )
 
-    # Build the SSH command as a shell string
-    # Using shell=True ensures the pw CLI gets the proper shell environment
-    cmd_str = (
-        f'ssh -i ~/.ssh/pwcli '
-        f'-L {local_port}:localhost:{remote_port} '
-        f'-o "ProxyCommand=pw ssh --proxy-command %h" '
-        f'-o StrictHostKeyChecking=no '
-        f'-o UserKnownHostsFile=/dev/null '
-        f'-N {user}@workspace'
-    )
+    # Build the SSH command line. ssh is exec'd directly, without a shell in between;
+    # the pw CLI gets its environment from env below.
+    argv = [
+        "ssh",
+        "-i", os.path.expanduser("~/.ssh/pwcli"),
+        "-L", f"{local_port}:localhost:{remote_port}",
+        "-o", "ProxyCommand=pw ssh --proxy-command %h",
+        "-o", "StrictHostKeyChecking=no",
+        "-o", "UserKnownHostsFile=/dev/null",
+        "-N", f"{user}@workspace",
+    ]
+
+    console = _console()
 
     # Set up environment with PW_PLATFORM_HOST extracted from API key
     env = os.environ.copy()
     api_key = env.get("PW_API_KEY", "")
     if api_key:
         try:
-            platform_host = extract_platform_host(api_key)
+            platform_host = _platform_host(api_key)
             env["PW_PLATFORM_HOST"] = platform_host
             if debug:
                 console.print(f"[dim]Extracted platform host: {platform_host}[/dim]")
@@ -74,20 +111,19 @@ def _start_ssh_tunnel(
                 console.print(f"[yellow]Warning: Could not extract host from API key: {e}[/yellow]")
 
     if debug:
-        console.print(f"[dim]Running: {cmd_str}[/dim]")
+        console.print(f"Running: {shlex.join(argv)}", markup=False, style="dim")
         if api_key:
             console.print(f"[dim]PW_API_KEY is set (length: {len(api_key)})[/dim]")
         else:
             console.print("[yellow]Warning: PW_API_KEY is not set[/yellow]")
 
-    # Start tunnel using shell=True with bash and pass environment with PW_PLATFORM_HOST
-    # Use start_new_session=True to create a new process group for clean termination
+    # Pass environment with PW_PLATFORM_HOST. start_new_session=True keeps ssh out of
+    # the terminal's process group, so Ctrl+C reaches only us and we close it in order.
+    # ssh -N writes nothing to stdout; stderr stays piped for error reporting
     process = subprocess.Popen(
-        cmd_str,
-        shell=True,
-        stdout=subprocess.PIPE,
+        argv,
+        stdout=subprocess.DEVNULL,
         stderr=subprocess.PIPE,
-        executable="/bin/bash",
         env=env,
         start_new_session=True,
     )
@@ -95,19 +131,52 @@ def _start_ssh_tunnel(
     return process
 
 
+def _short(text: Optional[str], width: int = 50) -> str:
+    """Truncate text to width characters, or "-" if empty."""
+    if not text:
+        return "-"
+    return text if len(text) <= width else text[:width] + "…"
+
+
+def _dumps(data) -> str:
+    """Serialize data as indented JSON, encoding datetimes natively.
+
+    Values with no JSON form fall back to str(), like json.dumps(default=str).
+    """
+    from pydantic_core import to_json
+
+    return to_json(data, indent=2, fallback=str).decode()
+
+
+def _client(ctx: click.Context) -> "PWClient":
+    """Return the PWClient shared by this invocation, opening it on first use.
+
+    The client is registered on the root context, which closes it when the
+    command finishes (including via sys.exit).
+    """
+    from .client import PWClient
+
+    root = ctx.find_root()
+    client = root.obj.get("client")
+    if client is None:
+        client = root.with_resource(PWClient())
+        root.obj["client"] = client
+    return client
+
+
 def print_error(message: str):
     """Print error message to stderr."""
-    console.print(f"[red]Error:[/red] {message}", style="red")
+    _console(stderr=True).print(f"[red]Error:[/red] {message}", style="red")
 
 
 def print_success(message: str):
     """Print success message."""
-    console.print(f"[green]{message}[/green]")
+    _console().print(f"[green]{message}[/green]")
 
 
-def print_status_update(run_info: RunInfo, elapsed: float):
+def print_status_update(run_info: "RunInfo", elapsed: float):
     """Print status update during polling."""
-    console.print(f"  Status: [cyan]{run_info.status}[/cyan] ({elapsed:.0f}s)")
+    _console().print(f"  Status: [cyan]{run_info.status}[/cyan] ({elapsed:.0f}s)")
 
 
 @click.group(invoke_without_command=True)
@@ -117,6 +186,8 @@ def main(ctx):
 
     Run without arguments for interactive mode.
     """
+    _load_dotenv()
+    ctx.ensure_object(dict)
     if ctx.invoked_subcommand is None:
         # No subcommand - run interactive mode
         from .interactive import run_interactive
@@ -126,37 +197,48 @@ def main(ctx):
 
 @main.command("list")
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
-def list_workflows(as_json: bool):
+@click.pass_context
+def list_workflows(ctx, as_json: bool):
     """List available workflows in the PW account."""
+    from .client import PWClientError
+    from .models import WORKFLOW_LIST_ADAPTER
+
     try:
-        with PWClient() as client:
-            workflows = client.list_workflows()
+        client = _client(ctx)
 
-            if as_json:
-                data = [w.model_dump(by_alias=True) for w in workflows]
-                click.echo(json.dumps(data, indent=2, default=str))
-                return
+        workflows = client.list_workflows()
 
-            if not workflows:
-                console.print("No workflows found.")
-                return
+        if as_json:
+            # Serialize straight from the models, without intermediate dicts
+            click.echo(WORKFLOW_LIST_ADAPTER.dump_json(workflows, by_alias=True, indent=2))
+            return
+
+        rows = [(w.name, w.display_name or "-", w.type, _short(w.description)) for w in workflows]
 
-            table = Table(title="Available Workflows")
-            table.add_column("Name", style="cyan")
-            table.add_column("Display Name")
-            table.add_column("Type")
-            table.add_column("Description")
+        if not sys.stdout.isatty():
+            # Piped output: write tab-separated rows, no rich rendering
+            for row in rows:
+                click.echo("\t".join(row))
+            return
+
+        console = _console()
+        if not rows:
+            console.print("No workflows found.")
+            return
+
+        from rich.table import Table
 
-            for w in workflows:
-                table.add_row(
-                    w.name,
-                    w.display_name or "-",
-                    w.type,
-                    (w.description[:50] + "...") if w.description and len(w.description) > 50 else (w.description or "-"),
-                )
+        table = Table(title="Available Workflows", expand=False, pad_edge=False)
+        table.add_column("Name", style="cyan")
+        table.add_column("Display Name")
+        table.add_column("Type")
+        table.add_column("Description")
 
-            console.print(table)
-            console.print(f"\nTotal: {len(workflows)} workflow(s)")
+        for row in rows:
+            table.add_row(*row)
+
+        console.print(table)
+        console.print(f"\nTotal: {len(rows)} workflow(s)")
 
     except PWClientError as e:
         print_error(str(e))
@@ -168,7 +250,13 @@ def list_workflows(as_json: bool):
 
 @main.command("run")
 @click.argument("workflow_name")
-@click.option("--input", "-i", "input_file", type=click.Path(exists=True), help="JSON input file")
+@click.option(
+    "--input",
+    "-i",
+    "input_file",
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    help="JSON input file",
+)
 @click.option("--param", "-p", "params", multiple=True, help="Input parameter as key=value")
 @click.option(
     "--type",
@@ -198,7 +286,9 @@ def list_workflows(as_json: bool):
     help="Automatically cancel the workflow after N seconds (useful for testing)",
 )
 @click.option("--debug", is_flag=True, help="Show debug info (SSH commands, etc.)")
+@click.pass_context
 def run_workflow(
+    ctx,
     workflow_name: str,
     input_file: Optional[str],
     params: tuple,
@@ -224,29 +314,42 @@ def run_workflow(
         # Session with SSH tunnel for local access
         pw-workflow-runner run helloworld --input inputs/helloworld.json --type session --tunnel
     """
+    from ._util import parse_param_value
+    from .client import PWClientError
+    from .executor import ExecutionTimeout, WorkflowExecutor
+    from .models import WorkflowType
+
+    console = _console()
+
     # Build inputs
     inputs = {}
 
     if input_file:
-        with open(input_file) as f:
-            inputs = json.load(f)
+        from pydantic_core import from_json
 
-    # Apply param overrides
+        try:
+            inputs = from_json(Path(input_file).read_bytes())
+        except ValueError as e:
+            print_error(f"Invalid JSON in {input_file}: {e}")
+            sys.exit(1)
+
+    # Parse param overrides, then apply them to inputs in one pass
+    overrides = []
     for param in params:
-        if "=" not in param:
+        key, sep, value = param.partition("=")
+        if not sep:
             print_error(f"Invalid param format: {param}. Use key=value or key.subkey=value")
             sys.exit(1)
 
-        key, value = param.split("=", 1)
-
-        # Try to parse value as JSON, fallback to string
-        try:
-            parsed_value = json.loads(value)
-        except json.JSONDecodeError:
-            parsed_value = value
+        # Try to parse value as JSON, fallback to string.
+        # Nested keys like "hello.message" become ("hello", "message")
+        overrides.append((tuple(key.split(".")), parse_param_value(value)))
 
-        # Handle nested keys like "hello.message"
-        _set_nested(inputs, key.split("."), parsed_value)
+    try:
+        _set_many_nested(inputs, overrides)
+    except ValueError as e:
+        print_error(str(e))
+        sys.exit(1)
 
     if not inputs and not input_file:
         print_error("No inputs provided. Use --input FILE or -p key=value")
@@ -264,49 +367,55 @@ def run_workflow(
     user = inputs.get("resource", {}).get("user", os.environ.get("USER", ""))
 
     try:
-        with PWClient() as client:
-            executor = WorkflowExecutor(client, timeout=timeout)
-
-            if not as_json:
-                type_label = "session" if wf_type == WorkflowType.SESSION else "batch"
-                console.print(f"Submitting {type_label} workflow: [cyan]{workflow_name}[/cyan]")
-
-            result = executor.execute(
-                workflow_name=workflow_name,
-                inputs=inputs,
-                workflow_type=wf_type,
-                on_status=None if as_json else print_status_update,
-                wait=not no_wait,
+        client = _client(ctx)
+        executor = WorkflowExecutor(client, timeout=timeout)
+
+        if not as_json:
+            type_label = "session" if wf_type == WorkflowType.SESSION else "batch"
+            console.print(f"Submitting {type_label} workflow: [cyan]{workflow_name}[/cyan]")
+
+        result = executor.execute(
+            workflow_name=workflow_name,
+            inputs=inputs,
+            workflow_type=wf_type,
+            on_status=None if as_json else print_status_update,
+            wait=not no_wait,
+        )
+
+        # For session workflows with tunnel, get the session port
+        session_port = None
+        if tunnel and result.success and wf_type == WorkflowType.SESSION:
+            session_info = client.get_session_for_run(workflow_name, result.run_number)
+            if session_info and session_info.local_port:
+                session_port = session_info.local_port
+            else:
+                print_error("Could not detect session port. Session may not be ready yet.")
+                sys.exit(1)
+
+        # Use user-specified port or auto-detected session port
+        tunnel_port = local_port if local_port is not None else session_port
+
+        _print_result(result, as_json, tunnel, tunnel_port)
+
+        # Start tunnel if requested and session is ready
+        if tunnel and result.success and wf_type == WorkflowType.SESSION and session_port:
+            _run_tunnel(
+                user, tunnel_port, session_port, cancel_after,
+                client, workflow_name, result.run_number, debug,
+            )
+        elif cancel_after and result.success:
+            # No tunnel, but cancel-after requested - wait and then cancel
+            console.print(f"\n[yellow]Will cancel workflow in {cancel_after} seconds...[/yellow]")
+            import time
+            time.sleep(cancel_after)
+            console.print(
+                f"\n[yellow]Cancelling workflow {workflow_name} "
+                f"run #{result.run_number}...[/yellow]"
             )
+            client.cancel_run(workflow_name, result.run_number)
+            console.print("[green]Workflow cancelled.[/green]")
 
-            # For session workflows with tunnel, get the session port
-            session_port = None
-            if tunnel and result.success and wf_type == WorkflowType.SESSION:
-                session_info = client.get_session_for_run(workflow_name, result.run_number)
-                if session_info and session_info.local_port:
-                    session_port = session_info.local_port
-                else:
-                    print_error("Could not detect session port. Session may not be ready yet.")
-                    sys.exit(1)
-
-            # Use user-specified port or auto-detected session port
-            tunnel_port = local_port if local_port is not None else session_port
-
-            _print_result(result, as_json, tunnel, tunnel_port)
-
-            # Start tunnel if requested and session is ready
-            if tunnel and result.success and wf_type == WorkflowType.SESSION and session_port:
-                _run_tunnel(user, tunnel_port, session_port, cancel_after, client, workflow_name, result.run_number, debug)
-            elif cancel_after and result.success:
-                # No tunnel, but cancel-after requested - wait and then cancel
-                console.print(f"\n[yellow]Will cancel workflow in {cancel_after} seconds...[/yellow]")
-                import time
-                time.sleep(cancel_after)
-                console.print(f"\n[yellow]Cancelling workflow {workflow_name} run #{result.run_number}...[/yellow]")
-                client.cancel_run(workflow_name, result.run_number)
-                console.print("[green]Workflow cancelled.[/green]")
-
-            sys.exit(0 if result.success else 1)
+        sys.exit(0 if result.success else 1)
 
     except PWClientError as e:
         print_error(str(e))
@@ -324,7 +433,8 @@ def run_workflow(
 @click.argument("run_number", type=int)
 @click.option("--json", "as_json", is_flag=True, help="Output as JSON")
 @click.option("--debug", is_flag=True, help="Show debug info about session matching")
-def check_status(workflow_name: str, run_number: int, as_json: bool, debug: bool):
+@click.pass_context
+def check_status(ctx, workflow_name: str, run_number: int, as_json: bool, debug: bool):
     """Check the status of a session workflow run.
 
     Note: This command queries the /api/sessions endpoint to find the session
@@ -334,54 +444,63 @@ def check_status(workflow_name: str, run_number: int, as_json: bool, debug: bool
 
         pw-workflow-runner status hello-world 42
     """
+    from .client import PWClientError
+
+    console = _console()
+
     try:
-        with PWClient() as client:
-            # Use sessions endpoint to find the session for this run
-            session_info = client.get_session_for_run(workflow_name, run_number, debug=debug)
+        client = _client(ctx)
+        # Use sessions endpoint to find the session for this run
+        session_info = client.get_session_for_run(workflow_name, run_number, debug=debug)
 
-            if session_info is None:
-                print_error(f"No session found for {workflow_name} run #{run_number}")
-                sys.exit(1)
+        if session_info is None:
+            print_error(f"No session found for {workflow_name} run #{run_number}")
+            sys.exit(1)
 
-            if as_json:
-                click.echo(json.dumps(session_info.model_dump(by_alias=True), indent=2, default=str))
-                return
+        if as_json:
+            click.echo(_dumps(session_info.model_dump(by_alias=True)))
+            return
 
-            # Show comprehensive status information
-            status = session_info.status or "unknown"
-            status_color = "green" if status.lower() == "running" else "yellow"
-
-            console.print(f"\n[bold]Workflow Run Status[/bold]")
-            console.print(f"  Workflow:    [cyan]{workflow_name}[/cyan]")
-            console.print(f"  Run:         #{run_number}")
-            console.print(f"  Status:      [{status_color}]{status}[/{status_color}]")
-
-            console.print(f"\n[bold]Session Details[/bold]")
-            console.print(f"  Session ID:  {session_info.id}")
-            if session_info.name:
-                console.print(f"  Name:        {session_info.name}")
-            if session_info.slug:
-                console.print(f"  Slug:        {session_info.slug}")
-            if session_info.type:
-                console.print(f"  Type:        {session_info.type}")
-            if session_info.user:
-                console.print(f"  User:        {session_info.user}")
-
-            console.print(f"\n[bold]Connection Info[/bold]")
-            if session_info.external_href:
-                console.print(f"  URL:         {session_info.external_href}")
-            if session_info.url:
-                console.print(f"  Internal:    {session_info.url}")
-            if session_info.domain_name:
-                console.print(f"  Domain:      {session_info.domain_name}")
-            if session_info.remote_host:
-                console.print(f"  Remote Host: {session_info.remote_host}")
-            if session_info.remote_port:
-                console.print(f"  Remote Port: {session_info.remote_port}")
-            if session_info.local_port:
-                console.print(f"  Local Port:  {session_info.local_port}")
-
-            console.print()
+        # Show comprehensive status information
+        status = session_info.status or "unknown"
+        status_color = "green" if status.lower() == "running" else "yellow"
+
+        # Build the whole report first and print it in one write
+        lines = [
+            "",
+            "[bold]Workflow Run Status[/bold]",
+            f"  Workflow:    [cyan]{workflow_name}[/cyan]",
+            f"  Run:         #{run_number}",
+            f"  Status:      [{status_color}]{status}[/{status_color}]",
+            "",
+            "[bold]Session Details[/bold]",
+            f"  Session ID:  {session_info.id}",
+        ]
+        if session_info.name:
+            lines.append(f"  Name:        {session_info.name}")
+        if session_info.slug:
+            lines.append(f"  Slug:        {session_info.slug}")
+        if session_info.type:
+            lines.append(f"  Type:        {session_info.type}")
+        if session_info.user:
+            lines.append(f"  User:        {session_info.user}")
+
+        lines += ["", "[bold]Connection Info[/bold]"]
+        if session_info.external_href:
+            lines.append(f"  URL:         {session_info.external_href}")
+        if session_info.url:
+            lines.append(f"  Internal:    {session_info.url}")
+        if session_info.domain_name:
+            lines.append(f"  Domain:      {session_info.domain_name}")
+        if session_info.remote_host:
+            lines.append(f"  Remote Host: {session_info.remote_host}")
+        if session_info.remote_port:
+            lines.append(f"  Remote Port: {session_info.remote_port}")
+        if session_info.local_port:
+            lines.append(f"  Local Port:  {session_info.local_port}")
+        lines.append("")
+
+        console.print("\n".join(lines))
 
     except PWClientError as e:
         print_error(str(e))
@@ -391,20 +510,49 @@ def check_status(workflow_name: str, run_number: int, as_json: bool, debug: bool
         sys.exit(1)
 
 
-def _set_nested(d: dict, keys: list[str], value):
-    """Set a nested dictionary value given a list of keys."""
-    for key in keys[:-1]:
-        d = d.setdefault(key, {})
-    d[keys[-1]] = value
+def _set_many_nested(
+    d: dict, pairs: list[tuple[tuple[str, ...], Any]], prefix: tuple[str, ...] = ()
+):
+    """Set nested dictionary values for many (key path, value) pairs in one walk.
+
+    Pairs are grouped by their first key and each group is applied recursively,
+    so paths sharing a prefix walk the shared dicts once. Within a group, a
+    direct assignment replaces everything set before it, which matches applying
+    the pairs one at a time in order.
+
+    Raises:
+        ValueError: If a path runs through an existing value that is not a dict.
+    """
+    groups: dict[str, list[tuple[tuple[str, ...], Any]]] = {}
+    for keys, value in pairs:
+        groups.setdefault(keys[0], []).append((keys[1:], value))
+
+    for key, items in groups.items():
+        path = (*prefix, key)
+        last = next((i for i in reversed(range(len(items))) if not items[i][0]), None)
+        if last is not None:
+            d[key] = items[last][1]
+            items = items[last + 1 :]
+            if not items:
+                continue
+
+        child = d.setdefault(key, {})
+        if not isinstance(child, dict):
+            raise ValueError(
+                f"Cannot set {'.'.join(path + items[0][0])}: {'.'.join(path)} is not an object"
+            )
+        _set_many_nested(child, items, path)
 
 
 def _print_result(
-    result: ExecutionResult,
+    result: "ExecutionResult",
     as_json: bool,
     tunnel: bool = False,
     local_port: Optional[int] = None,
 ):
     """Print execution result."""
+    from .models import WorkflowType
+
     if as_json:
         data = {
             "workflow_name": result.workflow_name,
@@ -419,9 +567,10 @@ def _print_result(
         }
         if tunnel and result.success and local_port:
             data["local_url"] = f"http://localhost:{local_port}"
-        click.echo(json.dumps(data, indent=2))
+        click.echo(_dumps(data))
         return
 
+    console = _console()
     console.print()
     if result.success:
         if result.workflow_type == WorkflowType.SESSION:
@@ -440,6 +589,80 @@ def _print_result(
         console.print(f"  Duration: {result.duration_seconds:.1f}s")
 
 
+def _drain_stderr(stream, lines: "deque[str]") -> None:
+    """Read a process's stderr until EOF, keeping only the most recent lines.
+
+    Keeps the pipe empty so a chatty ssh never blocks writing to a full buffer.
+
+    Args:
+        stream: The process's stderr pipe.
+        lines: Bounded deque that receives the decoded lines.
+    """
+    for line in iter(stream.readline, b""):
+        lines.append(line.decode(errors="replace").rstrip())
+    stream.close()
+
+
+def _wait_for_tunnel(
+    tunnel_process: "subprocess.Popen", local_port: int, timeout: float = 5.0
+) -> bool:
+    """Wait until the tunnel's local port accepts connections.
+
+    Args:
+        tunnel_process: Popen process for the SSH tunnel.
+        local_port: Local port the tunnel forwards.
+        timeout: Maximum time to wait (seconds).
+
+    Returns:
+        True once the port accepts a connection, False if ssh exited or the wait timed out.
+    """
+    import socket
+    import time
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if tunnel_process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection(("127.0.0.1", local_port), timeout=0.1):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+def _wait_process(process: "subprocess.Popen", timeout: float) -> bool:
+    """Wait up to timeout seconds for a process to exit.
+
+    On Linux this sleeps on a pidfd until the kernel reports the exit, instead of
+    the short sleep-and-poll loop Popen.wait(timeout) runs on POSIX.
+
+    Returns:
+        True if the process has exited.
+    """
+    import subprocess
+
+    if process.poll() is not None:
+        return True
+
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            return False
+        return True
+
+    import select
+
+    try:
+        select.select([pidfd], [], [], timeout)
+    finally:
+        os.close(pidfd)
+    return process.poll() is not None
+
+
 def _run_tunnel(
     user: str,
     local_port: int,
@@ -462,6 +685,7 @@ def _run_tunnel(
         run_number: Run number (required if cancel_after is set).
         debug: If True, print debug info.
     """
+    console = _console()
     console.print()
     console.print("[cyan]Starting SSH tunnel...[/cyan]")
     console.print(f"  Forwarding localhost:{local_port} -> workspace:{remote_port}")
@@ -470,9 +694,8 @@ def _run_tunnel(
     try:
         tunnel_process = _start_ssh_tunnel(user, local_port, remote_port, debug=debug)
 
-        # Give it a moment to connect
-        import time
-        time.sleep(2)
+        # Wait until the forwarded port accepts connections (or ssh exits)
+        port_ready = _wait_for_tunnel(tunnel_process, local_port)
 
         # Check if tunnel started successfully
         if tunnel_process.poll() is not None:
@@ -481,7 +704,24 @@ def _run_tunnel(
             print_error(f"SSH tunnel failed to start: {stderr.decode().strip()}")
             return
 
+        # Keep reading ssh's stderr from here on so the pipe never fills up
+        import threading
+        from collections import deque
+
+        stderr_tail: deque[str] = deque(maxlen=64)
+        threading.Thread(
+            target=_drain_stderr, args=(tunnel_process.stderr, stderr_tail), daemon=True
+        ).start()
+
+        def print_stderr_tail(count: int = 10):
+            for line in list(stderr_tail)[-count:]:
+                console.print(f"  {line}", markup=False, style="dim")
+
         console.print("[green]Tunnel established![/green]")
+        if not port_ready:
+            console.print(
+                "[dim]Local port not accepting connections yet; ssh may still be connecting[/dim]"
+            )
         console.print(f"  Access your session at: [link=http://localhost:{local_port}]http://localhost:{local_port}[/link]")
         console.print()
 
@@ -493,22 +733,15 @@ def _run_tunnel(
         # Handle cleanup
         def cleanup(cancel_workflow: bool = False):
             console.print("\n[yellow]Closing tunnel...[/yellow]")
-            # Kill the entire process group (needed when shell=True)
-            try:
-                pgid = os.getpgid(tunnel_process.pid)
-                os.killpg(pgid, signal.SIGTERM)
-            except (ProcessLookupError, OSError):
-                # Process already dead
-                pass
-            try:
-                tunnel_process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
+            tunnel_process.terminate()
+            if not _wait_process(tunnel_process, 5):
                 # Force kill if it doesn't respond
-                try:
-                    os.killpg(os.getpgid(tunnel_process.pid), signal.SIGKILL)
-                except (ProcessLookupError, OSError):
-                    pass
+                tunnel_process.kill()
+                tunnel_process.wait()
             console.print("[green]Tunnel closed.[/green]")
+            if debug and stderr_tail:
+                console.print("[dim]Last ssh output:[/dim]")
+                print_stderr_tail()
 
             if cancel_workflow and client and workflow_name and run_number:
                 console.print(f"[yellow]Cancelling workflow {workflow_name} run #{run_number}...[/yellow]")
@@ -518,25 +751,26 @@ def _run_tunnel(
                 except Exception as e:
                     print_error(f"Failed to cancel workflow: {e}")
 
-        # Wait for the tunnel process or user interrupt
-        def handle_sigint(signum, frame):
-            cleanup(cancel_workflow=False)
-            sys.exit(0)
-
-        signal.signal(signal.SIGINT, handle_sigint)
+        # Wait for the tunnel to exit, the cancel timeout, or Ctrl+C, then clean up once
+        interrupted = False
+        ssh_exited = False
+        try:
+            if cancel_after:
+                ssh_exited = _wait_process(tunnel_process, cancel_after)
+            else:
+                tunnel_process.wait()
+                ssh_exited = True
+        except KeyboardInterrupt:
+            interrupted = True
+
+        if ssh_exited:
+            # ssh died on its own; report it even when --cancel-after is pending
+            print_error(f"SSH tunnel exited with code {tunnel_process.returncode}")
+            print_stderr_tail()
+            if not cancel_after:
+                return
 
-        if cancel_after:
-            # Wait for cancel_after seconds, then cancel
-            start_time = time.time()
-            while time.time() - start_time < cancel_after:
-                if tunnel_process.poll() is not None:
-                    # Tunnel died
-                    break
-                time.sleep(1)
-            cleanup(cancel_workflow=True)
-        else:
-            # Keep the main process alive while tunnel runs
-            tunnel_process.wait()
+        cleanup(cancel_workflow=not interrupted)
 
     except RuntimeError as e:
         print_error(str(e))
@@ -1,11 +1,44 @@
 """PW SDK client wrapper for workflow operations."""
 
 import os
-from typing import Optional
+import threading
+import time
+from collections.abc import Callable, Iterable
+from importlib.util import find_spec
+from typing import Any, Optional, TypeVar
 
+import httpx
 from parallelworks_client import Client
+from pydantic_core import from_json, to_json
 
-from .models import RunInfo, SessionInfo, SubmitResponse, WorkflowInfo
+from .models import (
+    SESSION_LIST_ADAPTER,
+    WORKFLOW_LIST_ADAPTER,
+    RunInfo,
+    SessionInfo,
+    SubmitResponse,
+    WorkflowInfo,
+)
+
+# httpx closes idle connections after 5s by default, which is shorter than the
+# executor's polling interval, so every poll would open a new TLS connection.
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=60)
+
+# HTTP/2 lets concurrent requests share one connection. httpx needs the optional
+# h2 package for it (pip install "pw-workflow-runner[http2]").
+_HTTP2 = find_spec("h2") is not None
+
+# How long a fetched session list is reused. Pollers for different runs that wake
+# within the same tick share one /api/sessions request instead of each making one.
+_SESSIONS_TTL = 2.0
+
+# Most responses kept for HTTP caching; the oldest entry is dropped past this
+_RESPONSE_CACHE_SIZE = 256
+
+T = TypeVar("T")
+
+# Raw session dicts keyed by (workflow_name, run_number); workflow_name may be None
+_SessionIndex = dict[tuple[Optional[str], int], dict[str, Any]]
 
 
 class PWClientError(Exception):
@@ -29,39 +62,120 @@ class PWClient:
                 "PW_API_KEY is required. Set it as an environment variable or pass it to PWClient."
             )
         self._sync_client = None
+        self._sessions_lock = threading.Lock()
+        self._sessions_snapshot: Optional[
+            tuple[float, tuple[list[dict[str, Any]], _SessionIndex]]
+        ] = None
+        # (request path, parser) -> (ETag, parsed result, monotonic time until which
+        # the result is fresh per Cache-Control max-age) of the last full response
+        self._response_cache: dict[
+            tuple[str, Callable], tuple[Optional[str], Any, float]
+        ] = {}
+        self._response_cache_lock = threading.Lock()
 
     def __enter__(self) -> "PWClient":
         self._context = Client.from_credential(self.api_key).sync()
         self._sync_client = self._context.__enter__()
+
+        # The SDK's SyncClient has no hook for httpx options, so rebuild its client
+        # with the same settings plus a pool that keeps connections alive between
+        # polls, and HTTP/2 when available. No transport is passed, so httpx still
+        # mounts the HTTP(S)_PROXY/ALL_PROXY proxies from the environment.
+        sdk_http = self._sync_client._client
+        self._sync_client._client = httpx.Client(
+            base_url=sdk_http.base_url,
+            headers=sdk_http.headers,
+            timeout=sdk_http.timeout,
+            auth=sdk_http.auth,
+            limits=_HTTP_LIMITS,
+            http2=_HTTP2,
+        )
+        sdk_http.close()
         return self
 
     def __exit__(self, *args):
         if self._context:
             self._context.__exit__(*args)
 
+    def _get_parsed(self, path: str, parse: Callable[[bytes], T], force: bool = False) -> T:
+        """GET a path and parse the response body, honoring HTTP caching headers.
+
+        See _fetch_parsed().
+        """
+        return self._fetch_parsed(path, parse, force)[0]
+
+    def _fetch_parsed(
+        self, path: str, parse: Callable[[bytes], T], force: bool = False
+    ) -> tuple[T, Optional[httpx.Response]]:
+        """GET a path and parse the response body, honoring HTTP caching headers.
+
+        While a response for the path (parsed the same way) is still fresh per
+        its Cache-Control max-age, the earlier parsed result is returned without
+        a request. After that, if it carried an ETag, the request sends it as
+        If-None-Match, and a 304 Not Modified returns the earlier parsed result
+        without downloading or validating the body again.
+
+        Args:
+            path: API path to GET.
+            parse: Parser for the response body.
+            force: If True, always make a request, even if the cached response
+                   is still fresh.
+
+        Returns:
+            Tuple of (parsed result, the response it came from, or None if no
+            request was made).
+        """
+        key = (path, parse)
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+        if cached and not force and cached[2] > time.monotonic():
+            return cached[1], None
+
+        headers = {"If-None-Match": cached[0]} if cached and cached[0] else None
+        response = self._sync_client.get(path, headers=headers)
+        if headers and response.status_code == 304:
+            result = cached[1]
+            etag = response.headers.get("ETag") or cached[0]
+        else:
+            response.raise_for_status()
+            result = parse(response.content)
+            etag = response.headers.get("ETag")
+
+        max_age = _max_age(response)
+        with self._response_cache_lock:
+            # Re-inserted so the dict stays ordered from least to most recently stored
+            self._response_cache.pop(key, None)
+            if etag or max_age:
+                self._response_cache[key] = (etag, result, time.monotonic() + max_age)
+                if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                    del self._response_cache[next(iter(self._response_cache))]
+        return result, response
+
     def list_workflows(self) -> list[WorkflowInfo]:
         """List all workflows available in the account.
 
         Returns:
             List of WorkflowInfo objects.
         """
-        response = self._sync_client.get("/api/workflows")
-        response.raise_for_status()
-        data = response.json()
-        return [WorkflowInfo.model_validate(w) for w in data]
+        return self._get_parsed("/api/workflows", WORKFLOW_LIST_ADAPTER.validate_json)
 
-    def get_workflow(self, workflow_name: str) -> WorkflowInfo:
+    def get_workflow(self, workflow_name: str, refresh: bool = False) -> WorkflowInfo:
         """Get details of a specific workflow.
 
+        Repeated lookups reuse the response for as long as its HTTP caching
+        headers allow (see _fetch_parsed()).
+
         Args:
             workflow_name: Name of the workflow.
+            refresh: If True, always request the workflow, even if the cached
+                     response is still fresh.
 
         Returns:
             WorkflowInfo object.
         """
-        response = self._sync_client.get(f"/api/workflows/{workflow_name}")
-        response.raise_for_status()
-        return WorkflowInfo.model_validate(response.json())
+        return self._get_parsed(
+            f"/api/workflows/{workflow_name}", WorkflowInfo.model_validate_json, force=refresh
+        )
 
     def submit_workflow(self, workflow_name: str, inputs: dict) -> tuple[RunInfo, Optional[str]]:
         """Submit a workflow run.
@@ -76,10 +190,12 @@ class PWClient:
         """
         response = self._sync_client.post(
             f"/api/workflows/{workflow_name}/runs",
-            json={"inputs": inputs},
+            # Serialized by pydantic-core; the same compact JSON httpx would send
+            content=to_json({"inputs": inputs}),
+            headers={"Content-Type": "application/json"},
         )
         response.raise_for_status()
-        submit_response = SubmitResponse.model_validate(response.json())
+        submit_response = SubmitResponse.model_validate_json(response.content)
         return submit_response.run, submit_response.redirect
 
     def get_run_status(self, workflow_name: str, run_number: int) -> RunInfo:
@@ -101,9 +217,28 @@ class PWClient:
         Raises:
             httpx.HTTPStatusError: Always raises 405 Method Not Allowed.
         """
-        response = self._sync_client.get(f"/api/workflows/{workflow_name}/runs/{run_number}")
-        response.raise_for_status()
-        return RunInfo.model_validate(response.json())
+        return self.poll_run_status(workflow_name, run_number)[0]
+
+    def poll_run_status(
+        self, workflow_name: str, run_number: int
+    ) -> tuple[RunInfo, Optional[float]]:
+        """Get the status of a workflow run and the server's requested poll delay.
+
+        Makes the same request as get_run_status(); see the warning there.
+
+        Args:
+            workflow_name: Name of the workflow.
+            run_number: Run number to check.
+
+        Returns:
+            Tuple of (RunInfo, seconds the server asked clients to wait before
+            polling this run again via Retry-After or X-Poll-Interval-Hint, or
+            None if it sent no such header).
+        """
+        run_info, response = self._fetch_parsed(
+            f"/api/workflows/{workflow_name}/runs/{run_number}", RunInfo.model_validate_json
+        )
+        return run_info, _poll_hint(response) if response is not None else None
 
     def cancel_run(self, workflow_name: str, run_number: int) -> None:
         """Cancel/delete a workflow run.
@@ -121,10 +256,21 @@ class PWClient:
         Returns:
             List of SessionInfo objects.
         """
-        response = self._sync_client.get("/api/sessions")
-        response.raise_for_status()
-        data = response.json()
-        return [SessionInfo.model_validate(s) for s in data]
+        return self._get_parsed("/api/sessions", SESSION_LIST_ADAPTER.validate_json)
+
+    def _recent_sessions(self) -> tuple[list[dict[str, Any]], _SessionIndex]:
+        """Return the raw session list and its run index, reusing a recent fetch.
+
+        A fetch is reused for _SESSIONS_TTL seconds. The lock makes concurrent
+        pollers wait for a fetch already in flight instead of issuing their own.
+        """
+        with self._sessions_lock:
+            now = time.monotonic()
+            snapshot = self._sessions_snapshot
+            if snapshot is None or now - snapshot[0] > _SESSIONS_TTL:
+                snapshot = (now, self._get_parsed("/api/sessions", _parse_session_index))
+                self._sessions_snapshot = snapshot
+            return snapshot[1]
 
     def get_session_for_run(
         self, workflow_name: str, run_number: int, debug: bool = False
@@ -139,19 +285,74 @@ class PWClient:
         Returns:
             SessionInfo if found, None otherwise.
         """
-        sessions = self.get_sessions()
+        sessions, index = self._recent_sessions()
         if debug:
             print(f"Looking for workflow={workflow_name}, run={run_number}")
             print(f"Found {len(sessions)} sessions")
-        for session in sessions:
-            if debug:
-                print(f"  Session {session.id}: workflow_run={session.workflow_run}")
-            if session.workflow_run and session.workflow_run.number == run_number:
-                # Match on run number. If workflow_name is available, verify it matches.
-                # The API sometimes returns workflow_name as None.
-                if (
-                    session.workflow_run.workflow_name is None
-                    or session.workflow_run.workflow_name == workflow_name
-                ):
-                    return session
+            for session in sessions:
+                print(f"  Session {session.get('id')}: workflow_run={session.get('workflowRun')}")
+        return _lookup_session(index, workflow_name, run_number)
+
+    def get_sessions_for_runs(
+        self, runs: Iterable[tuple[str, int]]
+    ) -> dict[tuple[str, int], Optional[SessionInfo]]:
+        """Find the sessions for several workflow runs with a single API call.
+
+        Args:
+            runs: (workflow_name, run_number) pairs to look up.
+
+        Returns:
+            Dict mapping each pair to its SessionInfo, or None if not found.
+        """
+        _, index = self._recent_sessions()
+        return {run: _lookup_session(index, *run) for run in runs}
+
+
+def _poll_hint(response: httpx.Response) -> Optional[float]:
+    """Return the poll delay the server asked for in a response, if any."""
+    hint = response.headers.get("Retry-After") or response.headers.get("X-Poll-Interval-Hint")
+    try:
+        return float(hint) if hint else None
+    except ValueError:
+        # Retry-After may also be an HTTP date; only the seconds form is used
         return None
+
+
+def _max_age(response: httpx.Response) -> float:
+    """Return how many seconds a response may be reused, from its Cache-Control."""
+    directives = [d.strip().lower() for d in response.headers.get("Cache-Control", "").split(",")]
+    if "no-cache" in directives or "no-store" in directives:
+        return 0.0
+    for directive in directives:
+        if directive.startswith("max-age="):
+            try:
+                return max(0.0, float(directive[len("max-age="):]))
+            except ValueError:
+                return 0.0
+    return 0.0
+
+
+def _parse_session_index(content: bytes) -> tuple[list[dict[str, Any]], _SessionIndex]:
+    """Parse a /api/sessions body into raw sessions and an index by run.
+
+    Only the keys the lookup needs are read here. A session is validated into a
+    SessionInfo once a caller asks for it, so polling does not validate every
+    session on the platform each tick. The first of any duplicates is kept.
+    """
+    sessions = from_json(content)
+    index: _SessionIndex = {}
+    for session in sessions:
+        run = session.get("workflowRun") or {}
+        if run.get("number") is not None:
+            index.setdefault((run.get("workflowName"), run["number"]), session)
+    return sessions, index
+
+
+def _lookup_session(
+    index: _SessionIndex, workflow_name: str, run_number: int
+) -> Optional[SessionInfo]:
+    """Find and validate the session for a workflow run in a session index."""
+    # Match on run number. The API sometimes returns workflow_name as None, so
+    # fall back to a session with no workflow name.
+    session = index.get((workflow_name, run_number)) or index.get((None, run_number))
+    return SessionInfo.model_validate(session) if session else None
@@ -2,14 +2,16 @@
 
 import random
 import time
-from dataclasses import dataclass, field
-from datetime import datetime
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Callable, Optional
 
 import httpx
 
 from .client import PWClient
-from .models import RunInfo, WorkflowType
+from .models import RunInfo, SessionInfo, WorkflowType
 
 
 class ExecutionTimeout(Exception):
@@ -24,7 +26,7 @@ class SessionValidationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class ExecutionResult:
     """Result of a workflow execution."""
 
@@ -52,11 +54,47 @@ class ExecutionResult:
 
 
 # Terminal statuses for batch workflows
-BATCH_TERMINAL_STATUSES = {"completed", "failed", "cancelled", "error"}
+BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled", "error"})
 
 # For session workflows, "running" is the target state
 SESSION_READY_STATUS = "running"
-SESSION_TERMINAL_STATUSES = {"failed", "cancelled", "error"}
+SESSION_TERMINAL_STATUSES = frozenset({"failed", "cancelled", "error"})
+
+
+def _monotonic_start(started_at: datetime) -> float:
+    """Return the time.monotonic() reading that corresponds to started_at."""
+    return time.monotonic() - (datetime.now(timezone.utc) - started_at).total_seconds()
+
+
+def _status_changed(previous: Optional[str], current: Optional[str]) -> bool:
+    """Return True if a run moved to a new status since the previous poll.
+
+    Pollers drop back to the initial interval when this happens: a run that just
+    changed state (e.g. queued -> running) is likely to change again soon, so
+    the next transition is seen without waiting out a fully backed-off interval.
+    The first poll of a run is not a change.
+    """
+    return previous is not None and current != previous
+
+
+def _session_run_info(
+    workflow_name: str,
+    run_number: int,
+    started_at: datetime,
+    status: str,
+    session_info: Optional[SessionInfo] = None,
+) -> RunInfo:
+    """Build the minimal RunInfo passed to status callbacks for a session run."""
+    return RunInfo(
+        id=session_info.id if session_info else "",
+        number=run_number,
+        status=status,
+        workflow_name=workflow_name,
+        workflow_id="",
+        workflow_display_name=workflow_name,
+        user=(session_info.user if session_info else None) or "",
+        created_at=started_at,
+    )
 
 
 class WorkflowExecutor:
@@ -77,13 +115,17 @@ class WorkflowExecutor:
             timeout: Maximum time to wait for completion (seconds).
             initial_poll_interval: Initial polling interval (seconds).
             max_poll_interval: Maximum polling interval (seconds).
-            backoff_factor: Multiplier for exponential backoff.
+            backoff_factor: Growth factor for the backoff between polls.
         """
         self.client = client
         self.timeout = timeout
         self.initial_poll_interval = initial_poll_interval
         self.max_poll_interval = max_poll_interval
         self.backoff_factor = backoff_factor
+        # Per-executor generator for poll jitter, so executors share no RNG state
+        self._rng = random.Random()
+        # Workflow name -> (mean seconds until a run finished, number of runs)
+        self._completion_stats: dict[str, tuple[float, int]] = {}
 
     def execute(
         self,
@@ -93,6 +135,7 @@ class WorkflowExecutor:
         session_name: Optional[str] = None,
         on_status: Optional[Callable[[RunInfo, float], None]] = None,
         wait: bool = True,
+        min_expected_duration: float = 0.0,
     ) -> ExecutionResult:
         """Execute a workflow and optionally wait for completion.
 
@@ -104,6 +147,8 @@ class WorkflowExecutor:
             on_status: Optional callback called on each status poll.
                        Receives (RunInfo, elapsed_seconds).
             wait: If True, poll until completion. If False, return immediately.
+            min_expected_duration: Seconds the run is known to take at least. No
+                       status requests are made until that much time has passed.
 
         Returns:
             ExecutionResult with the final status.
@@ -111,7 +156,7 @@ class WorkflowExecutor:
         Raises:
             ExecutionTimeout: If wait=True and timeout is exceeded.
         """
-        started_at = datetime.utcnow()
+        started_at = datetime.now(timezone.utc)
 
         # Submit the workflow
         run_info, redirect_url = self.client.submit_workflow(workflow_name, inputs)
@@ -136,6 +181,7 @@ class WorkflowExecutor:
                 session_name=session_name,
                 redirect_url=redirect_url,
                 on_status=on_status,
+                min_expected_duration=min_expected_duration,
             )
         else:
             return self._poll_until_complete(
@@ -143,14 +189,147 @@ class WorkflowExecutor:
                 run_number=run_info.number,
                 started_at=started_at,
                 on_status=on_status,
+                run_info=run_info,
+                min_expected_duration=min_expected_duration,
             )
 
+    def execute_many(
+        self,
+        jobs: list[tuple[str, dict]],
+        workflow_type: WorkflowType = WorkflowType.BATCH,
+        on_status: Optional[Callable[[RunInfo, float], None]] = None,
+        max_concurrency: int = 8,
+    ) -> list[ExecutionResult]:
+        """Submit several workflow runs and wait for all of them to finish.
+
+        Submissions, and the per-run status checks of batch runs, are spread over
+        up to max_concurrency threads sharing the client's connection pool, so a
+        round of N requests takes about as long as the slowest one. Session runs
+        are polled together: each poll interval issues a single /api/sessions
+        request covering every pending run, instead of one per run.
+
+        Args:
+            jobs: (workflow_name, inputs) pairs to submit.
+            workflow_type: Type of the workflows (batch or session).
+            on_status: Optional callback called when a run's status changes.
+                       Receives (RunInfo, elapsed_seconds).
+            max_concurrency: Maximum number of API requests in flight at once.
+
+        Returns:
+            ExecutionResults in the same order as jobs.
+
+        Raises:
+            ExecutionTimeout: If any run is still pending when the timeout is exceeded.
+        """
+        results = dict(self._execute_many(jobs, workflow_type, on_status, max_concurrency))
+        return [results[i] for i in range(len(jobs))]
+
+    def iter_execute_many(
+        self,
+        jobs: list[tuple[str, dict]],
+        workflow_type: WorkflowType = WorkflowType.BATCH,
+        on_status: Optional[Callable[[RunInfo, float], None]] = None,
+        max_concurrency: int = 8,
+    ) -> Iterator[ExecutionResult]:
+        """Like execute_many(), but yield each result as soon as its run finishes.
+
+        Results come in completion order, so callers can act on fast runs while
+        slow ones are still polled. Polling happens while the iterator is being
+        consumed; if it is abandoned early, polling stops, but the remaining runs
+        keep running on the platform and are not cancelled.
+
+        Args:
+            jobs: (workflow_name, inputs) pairs to submit.
+            workflow_type: Type of the workflows (batch or session).
+            on_status: Optional callback called when a run's status changes.
+                       Receives (RunInfo, elapsed_seconds).
+            max_concurrency: Maximum number of API requests in flight at once.
+
+        Yields:
+            ExecutionResults in the order the runs finish.
+
+        Raises:
+            ExecutionTimeout: If any run is still pending when the timeout is exceeded.
+        """
+        for _, result in self._execute_many(jobs, workflow_type, on_status, max_concurrency):
+            yield result
+
+    def _execute_many(
+        self,
+        jobs: list[tuple[str, dict]],
+        workflow_type: WorkflowType,
+        on_status: Optional[Callable[[RunInfo, float], None]],
+        max_concurrency: int,
+    ) -> Iterator[tuple[int, ExecutionResult]]:
+        """Submit and poll jobs, yielding (job index, result) as runs finish."""
+        started_at = datetime.now(timezone.utc)
+        t0 = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            # (workflow_name, run_number) -> redirect URL, in submission order
+            pending: dict[tuple[str, int], Optional[str]] = {}
+            submitted = pool.map(lambda job: self.client.submit_workflow(*job), jobs)
+            for (workflow_name, _), (run_info, redirect_url) in zip(jobs, submitted):
+                pending[(workflow_name, run_info.number)] = redirect_url
+            job_index = {run: i for i, run in enumerate(pending)}
+
+            last_status: dict[tuple[str, int], Optional[str]] = dict.fromkeys(pending)
+            interval = min(
+                (self._first_interval(workflow_name) for workflow_name, _ in pending),
+                default=self.initial_poll_interval,
+            )
+
+            while pending:
+                elapsed = time.monotonic() - t0
+
+                if elapsed > self.timeout:
+                    raise ExecutionTimeout(
+                        f"{len(pending)} of {len(jobs)} workflow runs timed out"
+                        f" after {elapsed:.1f}s"
+                    )
+
+                previous = dict(last_status)
+                finished = []
+                hint = None
+                if workflow_type == WorkflowType.SESSION:
+                    # One request resolves the session for every pending run
+                    sessions = self.client.get_sessions_for_runs(pending)
+                    for run, session_info in sessions.items():
+                        last_status[run], result = self._check_session(
+                            *run, started_at, session_info, pending[run],
+                            last_status[run], on_status, t0,
+                        )
+                        if result:
+                            finished.append((run, result))
+                else:
+                    polled = list(pool.map(lambda run: self.client.poll_run_status(*run), pending))
+                    # Honor the longest delay any of this round's responses asked for
+                    hint = max((h for _, h in polled if h), default=None)
+                    for run, (run_info, _) in zip(list(pending), polled):
+                        last_status[run], result = self._check_batch(
+                            *run, started_at, run_info, last_status[run], on_status, t0
+                        )
+                        if result:
+                            finished.append((run, result))
+
+                for run, result in finished:
+                    del pending[run]
+                    yield job_index[run], result
+                if not pending:
+                    return
+
+                if any(_status_changed(previous[run], last_status[run]) for run in pending):
+                    interval = self.initial_poll_interval
+                interval = self._wait(interval, self.timeout - elapsed, hint)
+
     def _poll_until_complete(
         self,
         workflow_name: str,
         run_number: int,
         started_at: datetime,
         on_status: Optional[Callable[[RunInfo, float], None]] = None,
+        run_info: Optional[RunInfo] = None,
+        min_expected_duration: float = 0.0,
     ) -> ExecutionResult:
         """Poll for batch workflow completion with exponential backoff.
 
@@ -159,6 +338,9 @@ class WorkflowExecutor:
             run_number: Run number to poll.
             started_at: When execution started.
             on_status: Optional callback for status updates.
+            run_info: Run status already known, e.g. from the submit response.
+                      If it is terminal, no status request is made.
+            min_expected_duration: Seconds to wait before the first status request.
 
         Returns:
             ExecutionResult with final status.
@@ -166,11 +348,22 @@ class WorkflowExecutor:
         Raises:
             ExecutionTimeout: If timeout exceeded.
         """
-        interval = self.initial_poll_interval
+        t0 = _monotonic_start(started_at)
         last_status = None
 
+        # Fast path: a run that already finished needs no polling state at all
+        if run_info is not None:
+            last_status, result = self._check_batch(
+                workflow_name, run_number, started_at, run_info, last_status, on_status, t0
+            )
+            if result:
+                return result
+
+        self._sleep_until(t0, min_expected_duration)
+        interval = self._first_interval(workflow_name)
+
         while True:
-            elapsed = (datetime.utcnow() - started_at).total_seconds()
+            elapsed = time.monotonic() - t0
 
             if elapsed > self.timeout:
                 raise ExecutionTimeout(
@@ -178,37 +371,60 @@ class WorkflowExecutor:
                 )
 
             # Get current status
-            run_info = self.client.get_run_status(workflow_name, run_number)
+            run_info, hint = self.client.poll_run_status(workflow_name, run_number)
+            previous = last_status
+            last_status, result = self._check_batch(
+                workflow_name, run_number, started_at, run_info, last_status, on_status, t0
+            )
+            if result:
+                return result
 
-            # Notify callback if status changed or first poll
-            if on_status and run_info.status != last_status:
-                on_status(run_info, elapsed)
-            last_status = run_info.status
+            if _status_changed(previous, last_status):
+                interval = self.initial_poll_interval
+            interval = self._wait(interval, self.timeout - elapsed, hint)
 
-            # Check if terminal
-            if run_info.status.lower() in BATCH_TERMINAL_STATUSES:
-                completed_at = datetime.utcnow()
-                duration = (completed_at - started_at).total_seconds()
+    def _check_batch(
+        self,
+        workflow_name: str,
+        run_number: int,
+        started_at: datetime,
+        run_info: RunInfo,
+        last_status: Optional[str],
+        on_status: Optional[Callable[[RunInfo, float], None]],
+        t0: float,
+    ) -> tuple[str, Optional[ExecutionResult]]:
+        """Handle one status poll of a batch workflow run.
 
-                return ExecutionResult(
-                    workflow_name=workflow_name,
-                    run_number=run_number,
-                    status=run_info.status,
-                    workflow_type=WorkflowType.BATCH,
-                    started_at=started_at,
-                    completed_at=completed_at,
-                    duration_seconds=duration,
-                    run_info=run_info,
-                    error_message=None if run_info.status.lower() == "completed" else run_info.status,
-                )
+        t0 is the time.monotonic() reading at started_at. Elapsed time and the
+        duration are measured against it, so they are not affected by changes to
+        the system clock.
 
-            # Wait before next poll with jitter
-            jitter = 1 + (random.random() - 0.5) * 0.2  # +/- 10% jitter
-            sleep_time = min(interval * jitter, self.max_poll_interval)
-            time.sleep(sleep_time)
+        Returns:
+            Tuple of (current status, ExecutionResult if the run reached a terminal state).
+        """
+        elapsed = time.monotonic() - t0
+
+        # Notify callback if status changed or first poll
+        if on_status and run_info.status != last_status:
+            on_status(run_info, elapsed)
 
-            # Increase interval for next iteration
-            interval = min(interval * self.backoff_factor, self.max_poll_interval)
+        # Check if terminal
+        if run_info.status.lower() in BATCH_TERMINAL_STATUSES:
+            completed_at = datetime.now(timezone.utc)
+            self._record_completion(workflow_name, elapsed)
+
+            return run_info.status, ExecutionResult(
+                workflow_name=workflow_name,
+                run_number=run_number,
+                status=run_info.status,
+                workflow_type=WorkflowType.BATCH,
+                started_at=started_at,
+                completed_at=completed_at,
+                duration_seconds=elapsed,
+                run_info=run_info,
+                error_message=None if run_info.status.lower() == "completed" else run_info.status,
+            )
+        return run_info.status, None
 
     def _poll_session_ready(
         self,
@@ -218,6 +434,7 @@ class WorkflowExecutor:
         session_name: Optional[str] = None,
         redirect_url: Optional[str] = None,
         on_status: Optional[Callable[[RunInfo, float], None]] = None,
+        min_expected_duration: float = 0.0,
     ) -> ExecutionResult:
         """Poll for session workflow to be ready.
 
@@ -233,6 +450,7 @@ class WorkflowExecutor:
             session_name: Session name for URL construction.
             redirect_url: Redirect URL from submit response.
             on_status: Optional callback for status updates.
+            min_expected_duration: Seconds to wait before the first session lookup.
 
         Returns:
             ExecutionResult with session URL.
@@ -240,12 +458,13 @@ class WorkflowExecutor:
         Raises:
             ExecutionTimeout: If timeout exceeded.
         """
-        interval = self.initial_poll_interval
+        t0 = _monotonic_start(started_at)
+        self._sleep_until(t0, min_expected_duration)
+        interval = self._first_interval(workflow_name)
         last_status = None
-        session_url = redirect_url
 
         while True:
-            elapsed = (datetime.utcnow() - started_at).total_seconds()
+            elapsed = time.monotonic() - t0
 
             if elapsed > self.timeout:
                 raise ExecutionTimeout(
@@ -254,87 +473,152 @@ class WorkflowExecutor:
 
             # Poll session status via /api/sessions endpoint
             session_info = self.client.get_session_for_run(workflow_name, run_number)
+            previous = last_status
+            last_status, result = self._check_session(
+                workflow_name, run_number, started_at, session_info, redirect_url,
+                last_status, on_status, t0,
+            )
+            if result:
+                return result
 
-            if session_info:
-                current_status = session_info.status or "unknown"
-
-                # Notify callback if status changed
-                if on_status and current_status != last_status:
-                    # Create a minimal RunInfo for the callback
-                    from .models import RunInfo
-                    run_info = RunInfo(
-                        id=session_info.id,
-                        number=run_number,
-                        status=current_status,
-                        workflow_name=workflow_name,
-                        workflow_id="",
-                        workflow_display_name=workflow_name,
-                        user=session_info.user or "",
-                        created_at=started_at,
-                    )
-                    on_status(run_info, elapsed)
-                last_status = current_status
-
-                # Check for failure states
-                if current_status.lower() in SESSION_TERMINAL_STATUSES:
-                    completed_at = datetime.utcnow()
-                    duration = (completed_at - started_at).total_seconds()
-
-                    return ExecutionResult(
-                        workflow_name=workflow_name,
-                        run_number=run_number,
-                        status=current_status,
-                        workflow_type=WorkflowType.SESSION,
-                        started_at=started_at,
-                        completed_at=completed_at,
-                        duration_seconds=duration,
-                        run_info=None,
-                        error_message=f"Session failed with status: {current_status}",
-                    )
+            if _status_changed(previous, last_status):
+                interval = self.initial_poll_interval
+            interval = self._wait(interval, self.timeout - elapsed)
 
-                # Use session URL from session info if available, fallback to redirect_url
-                actual_session_url = session_info.external_href or session_info.url or session_url
-
-                # Check if session is ready (status is "running")
-                # For SSH tunnel use cases, we don't need to validate the URL is HTTP-accessible
-                if current_status.lower() == SESSION_READY_STATUS:
-                    ready_at = datetime.utcnow()
-                    duration = (ready_at - started_at).total_seconds()
-
-                    return ExecutionResult(
-                        workflow_name=workflow_name,
-                        run_number=run_number,
-                        status=current_status,
-                        workflow_type=WorkflowType.SESSION,
-                        started_at=started_at,
-                        completed_at=ready_at,
-                        duration_seconds=duration,
-                        run_info=None,
-                        session_url=actual_session_url,
-                    )
-            else:
-                # Session not yet created, notify callback with starting status
-                if on_status and last_status != "starting":
-                    from .models import RunInfo
-                    run_info = RunInfo(
-                        id="",
-                        number=run_number,
-                        status="starting",
-                        workflow_name=workflow_name,
-                        workflow_id="",
-                        workflow_display_name=workflow_name,
-                        user="",
-                        created_at=started_at,
-                    )
-                    on_status(run_info, elapsed)
-                last_status = "starting"
+    def _check_session(
+        self,
+        workflow_name: str,
+        run_number: int,
+        started_at: datetime,
+        session_info: Optional[SessionInfo],
+        redirect_url: Optional[str],
+        last_status: Optional[str],
+        on_status: Optional[Callable[[RunInfo, float], None]],
+        t0: float,
+    ) -> tuple[str, Optional[ExecutionResult]]:
+        """Handle one status poll of a session workflow run.
+
+        t0 is the time.monotonic() reading at started_at, as for _check_batch().
+
+        Returns:
+            Tuple of (current status, ExecutionResult if the session is ready or failed).
+        """
+        elapsed = time.monotonic() - t0
 
-            # Wait before next poll with jitter
-            jitter = 1 + (random.random() - 0.5) * 0.2
-            sleep_time = min(interval * jitter, self.max_poll_interval)
-            time.sleep(sleep_time)
+        if session_info:
+            current_status = session_info.status or "unknown"
 
-            interval = min(interval * self.backoff_factor, self.max_poll_interval)
+            # Notify callback if status changed
+            if on_status and current_status != last_status:
+                run_info = _session_run_info(
+                    workflow_name, run_number, started_at, current_status, session_info
+                )
+                on_status(run_info, elapsed)
+
+            # Check for failure states
+            if current_status.lower() in SESSION_TERMINAL_STATUSES:
+                completed_at = datetime.now(timezone.utc)
+                self._record_completion(workflow_name, elapsed)
+
+                return current_status, ExecutionResult(
+                    workflow_name=workflow_name,
+                    run_number=run_number,
+                    status=current_status,
+                    workflow_type=WorkflowType.SESSION,
+                    started_at=started_at,
+                    completed_at=completed_at,
+                    duration_seconds=elapsed,
+                    run_info=None,
+                    error_message=f"Session failed with status: {current_status}",
+                )
+
+            # Use session URL from session info if available, fallback to redirect_url
+            actual_session_url = session_info.external_href or session_info.url or redirect_url
+
+            # Check if session is ready (status is "running")
+            # For SSH tunnel use cases, we don't need to validate the URL is HTTP-accessible
+            if current_status.lower() == SESSION_READY_STATUS:
+                ready_at = datetime.now(timezone.utc)
+                self._record_completion(workflow_name, elapsed)
+
+                return current_status, ExecutionResult(
+                    workflow_name=workflow_name,
+                    run_number=run_number,
+                    status=current_status,
+                    workflow_type=WorkflowType.SESSION,
+                    started_at=started_at,
+                    completed_at=ready_at,
+                    duration_seconds=elapsed,
+                    run_info=None,
+                    session_url=actual_session_url,
+                )
+            return current_status, None
+
+        # Session not yet created, notify callback with starting status
+        if on_status and last_status != "starting":
+            run_info = _session_run_info(workflow_name, run_number, started_at, "starting")
+            on_status(run_info, elapsed)
+        return "starting", None
+
+    def _first_interval(self, workflow_name: str) -> float:
+        """Return the first poll interval for a workflow, based on its earlier runs.
+
+        Workflows that finished quickly before are polled sooner, and slow ones
+        start closer to the maximum interval. Without history the configured
+        initial interval is used.
+        """
+        stats = self._completion_stats.get(workflow_name)
+        if not stats:
+            return self.initial_poll_interval
+        mean, _ = stats
+        return max(self.initial_poll_interval * 0.2, min(mean * 0.5, self.max_poll_interval))
+
+    def _record_completion(self, workflow_name: str, duration: float):
+        """Fold the time a run took to finish into its workflow's running mean."""
+        mean, count = self._completion_stats.get(workflow_name, (0.0, 0))
+        count += 1
+        self._completion_stats[workflow_name] = (mean + (duration - mean) / count, count)
+
+    def _sleep_until(self, t0: float, seconds: float):
+        """Sleep until `seconds` after the monotonic time t0, capped at the timeout."""
+        delay = min(seconds, self.timeout) - (time.monotonic() - t0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _wait(self, interval: float, remaining: float, hint: Optional[float] = None) -> float:
+        """Sleep for one poll interval and pick the next one.
+
+        The sleep is never shorter than the poll delay the server asked for, and
+        never longer than the time left before the timeout, so a timeout is
+        raised on time.
+
+        Args:
+            interval: Current polling interval (seconds).
+            remaining: Seconds left before the timeout.
+            hint: Poll delay from the last status response (Retry-After or
+                  X-Poll-Interval-Hint), if it sent one.
+
+        Returns:
+            The interval to use for the next poll.
+        """
+        sleep_time = min(interval, self.max_poll_interval)
+        if hint:
+            sleep_time = max(sleep_time, hint)
+        time.sleep(max(0.0, min(sleep_time, remaining)))
+        return self._next_interval(interval)
+
+    def _next_interval(self, interval: float) -> float:
+        """Return the poll interval to use after one of the given length.
+
+        Uses "decorrelated jitter" backoff: the next interval is drawn uniformly
+        between the initial interval and 2 * backoff_factor times the current one
+        (3x with the default factor), capped at max_poll_interval. Because each
+        draw depends on the previous one rather than on the poll count, runs
+        submitted together drift apart instead of polling in lockstep.
+        """
+        base = min(self.initial_poll_interval, interval)
+        upper = interval * self.backoff_factor * 2
+        return min(self.max_poll_interval, self._rng.uniform(base, upper))
 
     def _validate_session_url(self, url: str) -> bool:
         """Check if session URL is accessible.
@@ -1,19 +1,26 @@
 """Interactive mode for workflow execution."""
 
-import json
+from __future__ import annotations
+
 import sys
 from pathlib import Path
 
+from pydantic_core import from_json
 from rich.console import Console
 from rich.prompt import Confirm, IntPrompt, Prompt
 from rich.table import Table
+from rich.text import Text
 
+from ._util import parse_param_value
 from .client import PWClient, PWClientError
 from .executor import ExecutionResult, ExecutionTimeout, WorkflowExecutor
 from .models import RunInfo, WorkflowInfo
 
 console = Console()
 
+# Style for a run status in progress output; other statuses are shown in cyan
+_STATUS_STYLES = {"completed": "green"}
+
 
 def run_interactive():
     """Run the interactive workflow execution flow."""
@@ -89,13 +96,15 @@ def _select_workflow(client: PWClient) -> WorkflowInfo | None:
         if selection.lower() == "q":
             return None
 
-        try:
-            idx = int(selection) - 1
-            if 0 <= idx < len(workflows):
-                return workflows[idx]
-            console.print(f"[yellow]Please enter a number between 1 and {len(workflows)}[/yellow]")
-        except ValueError:
+        selection = selection.strip()
+        if not selection.isdecimal():
             console.print("[yellow]Please enter a valid number[/yellow]")
+            continue
+
+        idx = int(selection) - 1
+        if 0 <= idx < len(workflows):
+            return workflows[idx]
+        console.print(f"[yellow]Please enter a number between 1 and {len(workflows)}[/yellow]")
 
 
 def _get_inputs() -> dict | None:
@@ -133,11 +142,10 @@ def _load_inputs_from_file() -> dict | None:
             continue
 
         try:
-            with open(path) as f:
-                inputs = json.load(f)
+            inputs = from_json(path.read_bytes())
             console.print(f"[green]Loaded {len(inputs)} top-level parameter(s)[/green]")
             return inputs
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             console.print(f"[red]Invalid JSON: {e}[/red]")
         except Exception as e:
             console.print(f"[red]Error reading file: {e}[/red]")
@@ -162,14 +170,15 @@ def _enter_inputs_manually() -> dict:
 
         key, value = line.split("=", 1)
 
-        # Try to parse as JSON
-        try:
-            parsed_value = json.loads(value)
-        except json.JSONDecodeError:
-            parsed_value = value
+        # Try to parse as JSON, fallback to string
+        parsed_value = parse_param_value(value)
 
-        # Handle nested keys
-        _set_nested(inputs, key.strip().split("."), parsed_value)
+        # Handle nested keys; plain keys are set directly
+        key = key.strip()
+        if "." in key:
+            _set_nested(inputs, key.split("."), parsed_value)
+        else:
+            inputs[key] = parsed_value
         console.print(f"  [dim]Set {key}[/dim]")
 
     return inputs
@@ -189,8 +198,8 @@ def _execute_workflow(client: PWClient, workflow_name: str, inputs: dict):
     console.print(f"Submitting [cyan]{workflow_name}[/cyan]...")
 
     def on_status(run_info: RunInfo, elapsed: float):
-        status_color = "green" if run_info.status.lower() == "completed" else "cyan"
-        console.print(f"  Status: [{status_color}]{run_info.status}[/] ({elapsed:.0f}s)")
+        style = _STATUS_STYLES.get(run_info.status.lower(), "cyan")
+        console.print("  Status:", Text(run_info.status, style=style), f"({elapsed:.0f}s)")
 
     try:
         result = executor.execute(
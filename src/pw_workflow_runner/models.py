@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class WorkflowType(str, Enum):
@@ -29,8 +29,7 @@ class WorkflowInfo(BaseModel):
     directory: Optional[str] = None
     app: Optional[bool] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class RunInfo(BaseModel):
@@ -45,11 +44,11 @@ class RunInfo(BaseModel):
     user: str
     created_at: datetime = Field(alias="createdAt")
     completed_at: Optional[datetime] = Field(None, alias="completedAt")
-    variables: Optional[list[dict[str, Any]]] = None
-    executed_jobs: Optional[list[dict[str, Any]]] = Field(None, alias="executedJobs")
+    # Passed through as parsed JSON; nothing here inspects them, so they are not validated
+    variables: Any = None
+    executed_jobs: Any = Field(None, alias="executedJobs")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class SubmitResponse(BaseModel):
@@ -58,6 +57,8 @@ class SubmitResponse(BaseModel):
     run: RunInfo
     redirect: Optional[str] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 class SessionWorkflowRun(BaseModel):
     """Workflow run info embedded in session response."""
@@ -66,8 +67,7 @@ class SessionWorkflowRun(BaseModel):
     number: Optional[int] = None
     workflow_name: Optional[str] = Field(None, alias="workflowName")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 
 class SessionInfo(BaseModel):
@@ -88,5 +88,10 @@ class SessionInfo(BaseModel):
     user: Optional[str] = None
     workflow_run: Optional[SessionWorkflowRun] = Field(None, alias="workflowRun")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+
+
+# Validators for list responses, built once at import and run over the whole
+# list in pydantic-core
+WORKFLOW_LIST_ADAPTER = TypeAdapter(list[WorkflowInfo])
+SESSION_LIST_ADAPTER = TypeAdapter(list[SessionInfo])